@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import pytest
+
+from voicememowhisper.state import StateStore
+
+
+def test_state_resumes_across_reopen(tmp_path):
+    db = tmp_path / "state.sqlite"
+    store = StateStore(db)
+    store.mark_processed("guid-1", Path("/transcripts/guid-1.txt"), title="First memo")
+    store.close()
+
+    store = StateStore(db)
+    try:
+        assert store.is_processed("guid-1")
+        transcript, archived = store.get_state("guid-1")
+        assert transcript == Path("/transcripts/guid-1.txt")
+        assert archived is None
+        assert store.known_guids() == {"guid-1"}
+    finally:
+        store.close()
+
+
+def test_reads_fail_fast_once_db_thread_is_gone(tmp_path):
+    store = StateStore(tmp_path / "state.sqlite")
+    store.close()
+    # A dead DB thread must raise, not leave the caller blocked forever.
+    with pytest.raises(RuntimeError):
+        store.is_processed("guid-1")
+
+
+def test_db_thread_survives_write_failure(tmp_path):
+    store = StateStore(tmp_path / "state.sqlite")
+    try:
+        # Shadow the class-level INSERT with broken SQL for one batch to
+        # simulate a transient sqlite failure on the DB thread.
+        store._INSERT_SQL = "INSERT INTO missing_table VALUES (?, ?, ?, ?, ?, ?)"
+        store.mark_processed("guid-bad", Path("/transcripts/bad.txt"))
+        store.flush()  # the failed batch is dropped, not fatal
+
+        del store._INSERT_SQL  # restore the real statement
+        store.mark_processed("guid-good", Path("/transcripts/good.txt"))
+        store.flush()
+
+        assert not store.is_processed("guid-bad")
+        assert store.is_processed("guid-good")
+    finally:
+        store.close()
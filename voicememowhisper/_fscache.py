@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import functools
+import os
+import time
+from pathlib import Path
+from typing import Optional, Union
+
+# Watch mode re-lists the same paths over and over; a short TTL keeps repeat
+# probes free while staying close enough to the live filesystem. The TTL is
+# encoded in the cache key (time bucket), so entries expire by falling out of
+# the LRU rather than by explicit bookkeeping.
+_TTL_SECONDS = 2
+
+
+def _bucket() -> int:
+    return int(time.time()) // _TTL_SECONDS
+
+
+@functools.lru_cache(maxsize=4096)
+def _stat_bucketed(path_str: str, bucket: int) -> Optional[os.stat_result]:
+    try:
+        return os.stat(path_str)
+    except OSError:
+        return None
+
+
+def cached_stat(path: Union[str, Path]) -> Optional[os.stat_result]:
+    """Stat a path, reusing a result taken within the current TTL window."""
+    return _stat_bucketed(os.fspath(path), _bucket())
+
+
+def cached_exists(path: Union[str, Path]) -> bool:
+    return cached_stat(path) is not None
+
+
+def invalidate() -> None:
+    """Drop all cached probes; called when the watcher sees the tree change."""
+    _stat_bucketed.cache_clear()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import logging
+import sys
 import time
 import shutil
 import re
@@ -9,13 +10,18 @@ from datetime import datetime
 from dataclasses import replace
 from pathlib import Path
 
+from . import _fscache
 from .config import Settings, load_settings, DEFAULT_ARCHIVE_PATH, DEFAULT_TRANSCRIPT_PATH, DEFAULT_STATE_DB_PATH
 from .metadata import list_voice_memos, resolve_created_at
-from .service import VoiceMemoService
+from .paths import iter_files
 from .state import StateStore
 
 LOGGER = logging.getLogger("cli")
 
+# Compiled once; _parse_filename runs per transcript/archive file per --list.
+# Individual capture groups feed the datetime constructor directly.
+_FNAME_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})_(\d{2})-(\d{2})-(\d{2})_(.*)$")
+
 
 def _configure_logging(level: str) -> None:
     logging.basicConfig(
@@ -59,32 +65,35 @@ def _format_duration(seconds: float | None) -> str:
     return f"{rem}s"
 
 
-def _parse_filename(path: Path) -> tuple[str | None, str | None]:
+def _parse_filename(path: Path) -> tuple[datetime | None, str | None]:
     """Parse timestamp and title from filename."""
     stem = path.stem
     # Format: YYYY-MM-DD_HH-MM-SS_Title
-    match = re.match(r"^(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})_(.*)$", stem)
+    match = _FNAME_RE.match(stem)
     if match:
-        timestamp_str, title = match.groups()
         try:
-            dt = datetime.strptime(timestamp_str, "%Y-%m-%d_%H-%M-%S")
-            return dt.isoformat(), title
+            # Direct construction skips strptime's format-string machinery.
+            dt = datetime(
+                int(match[1]), int(match[2]), int(match[3]),
+                int(match[4]), int(match[5]), int(match[6]),
+            )
+            return dt, match[7]
         except ValueError:
             pass
-    
+
     if stem.startswith("undated_"):
         return None, stem[8:]
-    
+
     return None, stem
 
 
 def _list_recordings(settings: Settings) -> int:
     store: StateStore | None = None
-    db_rows: list[dict] = []
-    
+    db_rows: list = []
+
     try:
         store = StateStore(settings.state_db)
-        db_rows = [dict(r) for r in store.get_all_processed()]
+        db_rows = store.get_all_processed()
     except Exception as err:
         LOGGER.warning("Unable to read state database: %s", err)
     finally:
@@ -101,100 +110,81 @@ def _list_recordings(settings: Settings) -> int:
     # Key: GUID (if known) or Filename Stem (for orphans)
     all_items: dict[str, dict] = {}
 
+    # Map filenames to GUIDs based on DB to link files back to known records;
+    # one dict keyed by both full name and stem replaces the two parallel maps.
+    file_key_to_guid: dict[str, str] = {}
+    db_records_map: dict[str, object] = {}
+
+    for record in db_rows:
+        guid = record['guid']
+        db_records_map[guid] = record
+        for raw in (record['transcript_path'], record['archived_path']):
+            if raw:
+                p = Path(raw)
+                file_key_to_guid[p.name] = guid
+                file_key_to_guid[p.stem] = guid
+
     def get_item(key: str) -> dict:
-        if key not in all_items:
-            all_items[key] = {
+        item = all_items.get(key)
+        if item is None:
+            item = {
                 'key': key,
                 'created_at': None,
                 'duration': None,
                 'title': None,
                 't': False, 'a': False, 's': False,
             }
-        return all_items[key]
-
-    # Map filenames to GUIDs based on DB to link files back to known records
-    filename_to_guid: dict[str, str] = {}
-    stem_to_guid: dict[str, str] = {}
-    db_records_map: dict[str, dict] = {}
-    
-    for record in db_rows:
-        guid = record['guid']
-        db_records_map[guid] = record
-        if record['transcript_path']:
-            p = Path(record['transcript_path'])
-            filename_to_guid[p.name] = guid
-            stem_to_guid[p.stem] = guid
-        if record['archived_path']:
-            p = Path(record['archived_path'])
-            filename_to_guid[p.name] = guid
-            stem_to_guid[p.stem] = guid
+            # Seed from the state DB at creation so no separate enrichment
+            # pass over the records is needed afterwards.
+            record = db_records_map.get(key)
+            if record is not None:
+                if record['created_at']:
+                    try:
+                        item['created_at'] = datetime.fromisoformat(record['created_at'])
+                    except ValueError:
+                        pass
+                item['duration'] = record['duration'] or None
+                item['title'] = record['title'] or None
+            all_items[key] = item
+        return item
 
     # --- Phase 1: Process Source Memos (App) ---
     for memo in source_memos:
         item = get_item(memo.guid)
-        item['created_at'] = resolve_created_at(memo)
-        item['duration'] = memo.duration_seconds
+        item['created_at'] = resolve_created_at(memo) or item['created_at']
+        item['duration'] = memo.duration_seconds or item['duration']
         item['title'] = (memo.title or "").strip() or memo.guid
         item['s'] = True
 
     # --- Phase 2: Scan Directories for Files ---
     def process_file(path: Path, type_key: str):
-        filename = path.name
         stem = path.stem
-        
-        # Try exact filename match first, then stem match
-        guid = filename_to_guid.get(filename) or stem_to_guid.get(stem)
-        
-        if guid:
-            # Matches a known DB record
-            item = get_item(guid)
-            item[type_key] = True
-        else:
-            # Orphan file
-            item = get_item(stem)
-            item[type_key] = True
-            
-        # Extract metadata from filename if missing
-        parsed_dt_str, parsed_title = _parse_filename(path)
-        if not item['created_at']:
-            if parsed_dt_str:
-                try:
-                    item['created_at'] = datetime.fromisoformat(parsed_dt_str)
-                except ValueError:
-                    pass
-        
-        # Fallback to file mtime if still missing
-        if not item['created_at']:
+        guid = file_key_to_guid.get(path.name) or file_key_to_guid.get(stem)
+        item = get_item(guid or stem)
+        item[type_key] = True
+
+        # Parse the filename only when something is still missing.
+        if item['created_at'] is None or not item['title']:
+            parsed_dt, parsed_title = _parse_filename(path)
+            if item['created_at'] is None and parsed_dt is not None:
+                item['created_at'] = parsed_dt
+            if not item['title']:
+                item['title'] = parsed_title or stem
+
+        # Stat is the last resort; known timestamps skip the syscall entirely.
+        if item['created_at'] is None:
             item['created_at'] = datetime.fromtimestamp(path.stat().st_mtime)
-        
-        if not item['title']:
-            item['title'] = parsed_title or stem
 
-    if settings.transcript_dir.exists():
-        for f in settings.transcript_dir.glob("*.txt"):
+    # TTL-cached probes: repeat --list runs in watch workloads hit the cache.
+    if _fscache.cached_exists(settings.transcript_dir):
+        for f in iter_files(settings.transcript_dir, ".txt"):
             process_file(f, 't')
 
-    if settings.archive_dir and settings.archive_dir.exists():
-        for f in settings.archive_dir.glob("*.m4a"):
+    if settings.archive_dir and _fscache.cached_exists(settings.archive_dir):
+        for f in iter_files(settings.archive_dir, ".m4a"):
             process_file(f, 'a')
 
-    # --- Phase 3: Enrich with DB Metadata ---
-    # Only for items that already exist (from App or Files)
-    for guid, record in db_records_map.items():
-        if guid in all_items:
-            item = all_items[guid]
-            # Backfill if missing
-            if not item['created_at'] and record['created_at']:
-                try: item['created_at'] = datetime.fromisoformat(record['created_at'])
-                except ValueError: pass
-            
-            if not item['duration'] and record['duration']:
-                item['duration'] = record['duration']
-                
-            if not item['title'] and record['title']:
-                item['title'] = record['title']
-
-    # --- Phase 4: Finalize and Sort ---
+    # --- Phase 3: Finalize and Sort ---
     display_list = list(all_items.values())
     
     if not display_list:
@@ -214,25 +204,38 @@ def _list_recordings(settings: Settings) -> int:
         return str(to_naive(dt))
 
     display_list.sort(key=sort_key, reverse=True)
-    
-    # Print header
-    print("/-- Transcribed")
-    print("|/-- Archived")
-    print("||/-- Source Exists")
-    print(f"{'T':<1}{'A':<1}{'S':<1}  {'When':19}  {'Duration':8}  Title")
+
+    # Accumulate rows and flush with one write: one syscall instead of one
+    # per line, and no print() dispatch inside the loop.
+    lines = [
+        "/-- Transcribed",
+        "|/-- Archived",
+        "||/-- Source Exists",
+        f"{'T':<1}{'A':<1}{'S':<1}  {'When':19}  {'Duration':8}  Title",
+    ]
 
     for item in display_list:
         if not (item['s'] or item['t'] or item['a']):
             continue
 
-        when = item['created_at'].strftime("%Y-%m-%d %H:%M:%S") if item['created_at'] else "unknown"
+        dt = item['created_at']
+        if dt:
+            # Hand-built format beats strftime's format-string parser per row.
+            when = (
+                f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+                f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+            )
+        else:
+            when = "unknown"
         duration_str = _format_duration(item['duration'])
-        
+
         t_char = "✓" if item['t'] else "."
         a_char = "✓" if item['a'] else "."
         s_char = "✓" if item['s'] else "x"
-        
-        print(f"{t_char:<1}{a_char:<1}{s_char:<1}  {when:19}  {duration_str:<8}  {item['title'] or item['key']}")
+
+        lines.append(f"{t_char:<1}{a_char:<1}{s_char:<1}  {when:19}  {duration_str:<8}  {item['title'] or item['key']}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
     return 0
 
@@ -278,6 +281,10 @@ def main(argv: list[str] | None = None) -> int:
     if args.list:
         return _list_recordings(settings)
 
+    # Imported lazily so --list/--help never pay for the watchdog/transcriber
+    # module graph behind the service.
+    from .service import VoiceMemoService
+
     try:
         service = VoiceMemoService(settings)
     except Exception as err:
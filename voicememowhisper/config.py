@@ -1,15 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import functools
 import os
-import shlex
 from pathlib import Path
 from typing import Literal, Optional, Tuple
 
 
+@functools.cache
 def _safe_exists(path: Path) -> bool:
     try:
-        return path.exists()
+        return os.path.lexists(path)
     except PermissionError:
         return False
 
@@ -21,7 +22,14 @@ def _env_path(key: str, default: Path) -> Path:
 
 def _env_args(key: str) -> Tuple[str, ...]:
     raw = os.environ.get(key)
-    return tuple(shlex.split(raw)) if raw else ()
+    if not raw:
+        return ()
+    if not any(ch in raw for ch in "\"'\\"):
+        # No shell quoting in play; plain whitespace split skips the lexer.
+        return tuple(raw.split())
+    import shlex  # deferred: only needed when extra args are configured
+
+    return tuple(shlex.split(raw))
 
 
 DEFAULT_BASE_PATH = Path.home() / "Documents" / "VoiceMemoWhisper"
@@ -50,6 +58,7 @@ def parse_processing_order(value: str | None, default: ProcessingOrder = "newest
     raise ValueError("Invalid processing order. Use 'newest-first' or 'oldest-first'.")
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_default_paths() -> tuple[Path, Path, Path, Optional[Path]]:
     home = Path.home()
     candidate_roots = [
@@ -84,25 +93,30 @@ def _detect_default_paths() -> tuple[Path, Path, Path, Optional[Path]]:
     return fallback_root, fallback_root / "Recordings", metadata, legacy
 
 
-DEFAULT_CONTAINER, DEFAULT_RECORDINGS, DEFAULT_METADATA, DEFAULT_LEGACY_METADATA = _detect_default_paths()
+@functools.lru_cache(maxsize=1)
+def _default_container_root() -> Path:
+    return _env_path("VOICE_MEMO_CONTAINER", _detect_default_paths()[0])
 
 
+@functools.lru_cache(maxsize=1)
 def _default_recordings_dir() -> Path:
     container = os.environ.get("VOICE_MEMO_CONTAINER")
     if container:
         return Path(container).expanduser() / "Recordings"
-    return DEFAULT_RECORDINGS
+    return _detect_default_paths()[1]
 
 
+@functools.lru_cache(maxsize=1)
 def _default_metadata_db() -> Path:
     container = os.environ.get("VOICE_MEMO_CONTAINER")
     if container:
         root = Path(container).expanduser()
         cloud = root / "Recordings" / "CloudRecordings.db"
         return cloud if _safe_exists(cloud) else root / "Library" / "Application Support" / "Recents.sqlite"
-    return DEFAULT_METADATA
+    return _detect_default_paths()[2]
 
 
+@functools.lru_cache(maxsize=1)
 def _default_legacy_metadata_db() -> Optional[Path]:
     container = os.environ.get("VOICE_MEMO_CONTAINER")
     if container:
@@ -114,29 +128,84 @@ def _default_legacy_metadata_db() -> Optional[Path]:
         if _safe_exists(recents) and not _safe_exists(cloud):
             return None
         return None
-    return DEFAULT_LEGACY_METADATA
+    return _detect_default_paths()[3]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Runtime configuration for the transcription service."""
-
-    container_root: Path = _env_path("VOICE_MEMO_CONTAINER", DEFAULT_CONTAINER)
-    recordings_dir: Path = _env_path("VOICE_MEMO_RECORDINGS_DIR", _default_recordings_dir())
-    metadata_db: Path = _env_path("VOICE_MEMO_METADATA_DB", _default_metadata_db())
-    legacy_metadata_db: Optional[Path] = _optional_env_path("VOICE_MEMO_LEGACY_METADATA_DB", _default_legacy_metadata_db())
-    transcript_dir: Path = _env_path(
-        "VOICE_MEMO_TRANSCRIPT_DIR", DEFAULT_TRANSCRIPT_PATH
+    """Runtime configuration for the transcription service.
+
+    Defaults are default_factory callables so importing this module does no
+    filesystem probing or environment reads; the cost is paid on the first
+    ``Settings()`` and the container detection is cached after that.
+    """
+
+    container_root: Path = field(default_factory=_default_container_root)
+    recordings_dir: Path = field(
+        default_factory=lambda: _env_path("VOICE_MEMO_RECORDINGS_DIR", _default_recordings_dir())
+    )
+    metadata_db: Path = field(
+        default_factory=lambda: _env_path("VOICE_MEMO_METADATA_DB", _default_metadata_db())
+    )
+    legacy_metadata_db: Optional[Path] = field(
+        default_factory=lambda: _optional_env_path(
+            "VOICE_MEMO_LEGACY_METADATA_DB", _default_legacy_metadata_db()
+        )
+    )
+    transcript_dir: Path = field(
+        default_factory=lambda: _env_path("VOICE_MEMO_TRANSCRIPT_DIR", DEFAULT_TRANSCRIPT_PATH)
+    )
+    archive_dir: Optional[Path] = field(
+        default_factory=lambda: _optional_env_path("VOICE_MEMO_ARCHIVE_DIR", DEFAULT_ARCHIVE_PATH)
     )
-    archive_dir: Optional[Path] = _optional_env_path("VOICE_MEMO_ARCHIVE_DIR", DEFAULT_ARCHIVE_PATH)
     archive_enabled: bool = False
-    state_db: Path = _env_path("VOICE_MEMO_STATE_DB", DEFAULT_STATE_DB_PATH)
-    whisperkit_cli: str = os.environ.get("VOICE_MEMO_WHISPERKIT_CLI", "whisperkit-cli")
-    whisperkit_model: str = os.environ.get("VOICE_MEMO_WHISPERKIT_MODEL", "large-v3-v20240930_turbo")
-    whisperkit_extra_args: Tuple[str, ...] = _env_args("VOICE_MEMO_WHISPERKIT_ARGS")
-    language: str | None = os.environ.get("VOICE_MEMO_LANGUAGE")
-    processing_order: ProcessingOrder = parse_processing_order(os.environ.get("VOICE_MEMO_PROCESSING_ORDER"))
+    state_db: Path = field(
+        default_factory=lambda: _env_path("VOICE_MEMO_STATE_DB", DEFAULT_STATE_DB_PATH)
+    )
+    whisperkit_cli: str = field(
+        default_factory=lambda: os.environ.get("VOICE_MEMO_WHISPERKIT_CLI", "whisperkit-cli")
+    )
+    whisperkit_model: str = field(
+        default_factory=lambda: os.environ.get(
+            "VOICE_MEMO_WHISPERKIT_MODEL", "large-v3-v20240930_turbo"
+        )
+    )
+    whisperkit_extra_args: Tuple[str, ...] = field(
+        default_factory=lambda: _env_args("VOICE_MEMO_WHISPERKIT_ARGS")
+    )
+    language: str | None = field(default_factory=lambda: os.environ.get("VOICE_MEMO_LANGUAGE"))
+    processing_order: ProcessingOrder = field(
+        default_factory=lambda: parse_processing_order(os.environ.get("VOICE_MEMO_PROCESSING_ORDER"))
+    )
+    # 0 means "auto": the service derives a worker count from the CPU count.
+    max_parallel_transcriptions: int = field(
+        default_factory=lambda: int(os.environ.get("VOICE_MEMO_MAX_PARALLEL", "0") or "0")
+    )
+    # Seconds the watcher may coalesce bursts of filesystem events before
+    # dispatching them; higher values trade latency for fewer wakeups.
+    watch_latency: float = field(
+        default_factory=lambda: float(os.environ.get("VOICE_MEMO_WATCH_LATENCY", "1.0") or "1.0")
+    )
+    # Force the watcher onto the polling backend; useful when the recordings
+    # directory sits on a network mount the auto-detection misses.
+    force_polling: bool = field(
+        default_factory=lambda: os.environ.get("VOICE_MEMO_FORCE_POLLING", "").lower()
+        in ("1", "true", "yes")
+    )
+    # Minimum seconds between metadata re-reads triggered by the same
+    # unknown recording.
+    metadata_refresh_interval: float = field(
+        default_factory=lambda: float(
+            os.environ.get("VOICE_MEMO_METADATA_REFRESH_INTERVAL", "10.0") or "10.0"
+        )
+    )
 
 
+@functools.lru_cache(maxsize=1)
 def load_settings() -> Settings:
+    """Build (and cache) the default Settings for this process.
+
+    Callers that need overrides go through dataclasses.replace on the shared
+    instance, so the environment and default paths are resolved exactly once.
+    """
     return Settings()
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 import logging
+import os
 import sqlite3
+import sys
 from pathlib import Path
-from typing import Iterable, List, Sequence, Optional, Dict
+from typing import List, Sequence, Optional, Dict
 
-from .config import Settings, load_settings
+from . import _fscache
+from .config import Settings
+from .paths import scan_files_with_stats
 
 LOGGER = logging.getLogger("metadata")
 MAC_EPOCH = datetime(2001, 1, 1, tzinfo=timezone.utc)
+# Unix timestamp of the mac epoch; lets us convert raw CoreData floats with
+# one addition instead of building timedelta/datetime objects per row.
+MAC_EPOCH_UNIX = 978307200.0
+# Resolved once: datetime.now().astimezone() hits time.localtime on every
+# call, and resolve_created_at runs per memo.
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
 GUID_COLUMNS: Sequence[str] = (
     "ZUNIQUEID",
     "ZUUID",
@@ -79,25 +89,40 @@ REFERENCE_COLUMNS: Sequence[str] = (
 
 _TABLE_COLUMN_CACHE: Dict[tuple[int, str], set[str]] = {}
 _TABLES_WITH_TITLES_CACHE: Dict[int, List[str]] = {}
+# Record-table discovery cached per (db path, mtime_ns): the schema never
+# changes without the file changing, so repeat loads skip the PRAGMA walk.
+_SCHEMA_CACHE: Dict[tuple[str, int], "tuple[str | None, tuple[str, ...]]"] = {}
+_SCHEMA_CACHE_MAX = 8
+# Side cache for resolve_created_at keyed by GUID; VoiceMemo is frozen, so the
+# memoized value lives here rather than on the instance. Reset whenever the
+# metadata database is re-read.
+_CREATED_AT_CACHE: Dict[str, "datetime | None"] = {}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VoiceMemo:
     guid: str
     path: Path
     title: str | None = None
-    created_at: datetime | None = None
+    created_at_raw: float | None = None
     duration_seconds: float | None = None
     is_trashed: bool = False
 
+    @property
+    def created_at(self) -> datetime | None:
+        """Creation time as an aware datetime, built lazily on access."""
+        if self.created_at_raw is None:
+            return None
+        return datetime.fromtimestamp(self.created_at_raw + MAC_EPOCH_UNIX, tz=timezone.utc)
 
-def _to_datetime(value: float | int | None) -> datetime | None:
+
+def _to_raw_timestamp(value) -> float | None:
     if value is None:
         return None
     try:
-        return MAC_EPOCH + timedelta(seconds=float(value))
-    except Exception:  # pragma: no cover
-        LOGGER.debug("Failed to convert %s to datetime", value, exc_info=True)
+        return float(value)
+    except (TypeError, ValueError):  # pragma: no cover
+        LOGGER.debug("Failed to convert %s to timestamp", value, exc_info=True)
         return None
 
 
@@ -127,16 +152,29 @@ def _normalize_value(value):
     return value
 
 
-def _pick(row: sqlite3.Row, candidates: Iterable[str]):
-    keys = row.keys()
-    for name in candidates:
-        if name in keys:
-            value = row[name]
-            if value not in (None, ""):
-                normalized = _normalize_value(value)
-                if normalized in (None, ""):
-                    continue
+def _pick_indexed(row: Sequence, indices: Sequence[int]):
+    """Return the first non-empty value at the given column positions."""
+    for i in indices:
+        value = row[i]
+        if value in (None, ""):
+            continue
+        normalized = _normalize_value(value)
+        if normalized in (None, ""):
+            continue
+        return normalized
+    return None
+
+
+def _pick_primary(row: Sequence, primary: int, alternates: Sequence[int]):
+    """Single tuple lookup on the usual column; scan alternates only on a miss."""
+    if primary >= 0:
+        value = row[primary]
+        if value not in (None, ""):
+            normalized = _normalize_value(value)
+            if normalized not in (None, ""):
                 return normalized
+    if alternates:
+        return _pick_indexed(row, alternates)
     return None
 
 
@@ -169,6 +207,47 @@ def _tables_with_titles(conn: sqlite3.Connection) -> List[str]:
     return result
 
 
+def _schema_for(conn: sqlite3.Connection, db_path: Path) -> tuple[str | None, tuple[str, ...]]:
+    """Return the record table and projected column list for a database.
+
+    Keyed on (path, mtime_ns) so schema changes invalidate automatically and
+    repeated loads of an unchanged database skip table discovery entirely.
+    """
+    try:
+        mtime_ns = os.stat(db_path).st_mtime_ns
+    except OSError:  # pragma: no cover - racing deletion
+        mtime_ns = -1
+    key = (str(db_path), mtime_ns)
+    cached = _SCHEMA_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    table = _find_record_table(conn)
+    if table:
+        cols = _table_columns(conn, table)
+        wanted = tuple(
+            name
+            for name in (
+                *GUID_COLUMNS,
+                *TITLE_COLUMNS,
+                *DATE_COLUMNS,
+                *DURATION_COLUMNS,
+                *PATH_COLUMNS,
+                *TRASH_COLUMNS,
+                *REFERENCE_COLUMNS,
+            )
+            if name in cols
+        )
+    else:
+        wanted = ()
+
+    result = (table, wanted)
+    if len(_SCHEMA_CACHE) >= _SCHEMA_CACHE_MAX:
+        _SCHEMA_CACHE.pop(next(iter(_SCHEMA_CACHE)))
+    _SCHEMA_CACHE[key] = result
+    return result
+
+
 def _find_record_table(conn: sqlite3.Connection) -> str | None:
     priority = [
         "ZCLOUDRECORDING",
@@ -190,37 +269,46 @@ def _find_record_table(conn: sqlite3.Connection) -> str | None:
     return None
 
 
-def _resolve_path(row: sqlite3.Row, settings: Settings, guid: str) -> Path:
-    keys = row.keys()
-    for name in PATH_COLUMNS:
-        if name in keys:
-            value = _normalize_value(row[name])
+def _resolve_path(
+    row: Sequence, path_primary: int, path_alts: Sequence[int], settings: Settings, guid: str
+) -> Path:
+    candidate = None
+    if path_primary >= 0:
+        value = _normalize_value(row[path_primary])
+        if isinstance(value, str) and value.strip():
+            candidate = value.strip()
+    if candidate is None:
+        for i in path_alts:
+            value = _normalize_value(row[i])
             if isinstance(value, str) and value.strip():
                 candidate = value.strip()
-                if candidate.startswith("file://"):
-                    candidate = candidate[7:]
-                if candidate.startswith("~/"):
-                    return Path(candidate).expanduser()
-                path = Path(candidate)
-                if path.is_absolute():
-                    return path
-                parts = path.parts
-                if parts and parts[0].lower() == "recordings":
-                    return settings.container_root / Path(*parts)
-                return settings.recordings_dir / path
-    return settings.recordings_dir / f"{guid}.m4a"
-
-
-def _resolve_related_title(conn: sqlite3.Connection, row: sqlite3.Row) -> str | None:
-    keys = row.keys()
+                break
+    if candidate is None:
+        return settings.recordings_dir / f"{guid}.m4a"
+
+    # Slice comparisons instead of startswith: no method dispatch per row.
+    if candidate[:7] == "file://":
+        candidate = candidate[7:]
+    if candidate[:2] == "~/":
+        return Path(candidate).expanduser()
+    path = Path(candidate)
+    if path.is_absolute():
+        return path
+    parts = path.parts
+    if parts and parts[0].lower() == "recordings":
+        return settings.container_root / Path(*parts)
+    return settings.recordings_dir / path
+
+
+def _resolve_related_title(
+    conn: sqlite3.Connection, row: Sequence, ref_indices: Sequence[int]
+) -> str | None:
     tables = _tables_with_titles(conn)
     if not tables:
         return None
 
-    for ref in REFERENCE_COLUMNS:
-        if ref not in keys:
-            continue
-        ref_value = row[ref]
+    for i in ref_indices:
+        ref_value = row[i]
         if ref_value in (None, 0):
             continue
         try:
@@ -228,29 +316,38 @@ def _resolve_related_title(conn: sqlite3.Connection, row: sqlite3.Row) -> str |
         except (TypeError, ValueError):
             continue
         for table in tables:
+            # Column layout is fixed per table; resolve the title columns once
+            # via the cached schema instead of SELECT * + row.keys() per hit.
+            title_cols = [c for c in TITLE_COLUMNS if c in _table_columns(conn, table)]
+            if not title_cols:
+                continue
             try:
-                candidate = conn.execute(f"SELECT * FROM {table} WHERE Z_PK = ? LIMIT 1", (ref_id,)).fetchone()
+                candidate = conn.execute(
+                    f"SELECT {', '.join(title_cols)} FROM {table} WHERE Z_PK = ? LIMIT 1",
+                    (ref_id,),
+                ).fetchone()
             except sqlite3.Error:
                 continue
             if not candidate:
                 continue
-            title = _pick(candidate, TITLE_COLUMNS)
+            title = _pick_indexed(candidate, range(len(title_cols)))
             if title:
                 return title
     return None
 
 
-def load_voice_memos(settings: Settings | None = None) -> dict[str, VoiceMemo]:
+def load_voice_memos(settings: Settings) -> dict[str, VoiceMemo]:
     """Load Voice Memo metadata keyed by GUID."""
-    settings = settings or load_settings()
     db_path = settings.metadata_db
     fallback = settings.legacy_metadata_db
 
     _TABLE_COLUMN_CACHE.clear()
     _TABLES_WITH_TITLES_CACHE.clear()
+    _CREATED_AT_CACHE.clear()
 
-    if not db_path.exists():
-        if fallback and fallback.exists():
+    # os.path.lexists is the C fast path; avoids building a stat result per probe.
+    if not os.path.lexists(db_path):
+        if fallback and os.path.lexists(fallback):
             LOGGER.info("Primary metadata database missing; using legacy database at %s", fallback)
             db_path = fallback
         else:
@@ -258,8 +355,19 @@ def load_voice_memos(settings: Settings | None = None) -> dict[str, VoiceMemo]:
             return {}
 
     try:
+        # No row factory: every consumer indexes by position, so plain
+        # tuples avoid a PyRow allocation per row.
         conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
-        conn.row_factory = sqlite3.Row
+        # The workload is one sequential scan; mmap the file and give the page
+        # cache room so the read avoids buffered-I/O copies. query_only guards
+        # against accidental writes on the read-only handle.
+        for pragma in (
+            "PRAGMA query_only=1",
+            "PRAGMA mmap_size=268435456",
+            "PRAGMA cache_size=-65536",
+            "PRAGMA temp_store=MEMORY",
+        ):
+            conn.execute(pragma)
     except sqlite3.OperationalError as err:  # pragma: no cover - sqlite permissions
         message = str(err).lower()
         if "permission" in message or "authorized" in message or "authorised" in message:
@@ -274,83 +382,159 @@ def load_voice_memos(settings: Settings | None = None) -> dict[str, VoiceMemo]:
         return {}
 
     with conn:
-        table = _find_record_table(conn)
+        # Project only the columns we read. ZCLOUDRECORDING carries dozens of
+        # BLOB columns that SQLite would otherwise materialize per row.
+        table, wanted = _schema_for(conn, db_path)
         if not table:
             LOGGER.warning("No suitable table found in metadata database %s", db_path)
             return {}
 
+        if not wanted:
+            LOGGER.warning("No recognized columns in metadata table %s", table)
+            return {}
+
+        index_of = {name: i for i, name in enumerate(wanted)}
+
+        def _indices(candidates: Sequence[str]) -> tuple[int, ...]:
+            return tuple(index_of[name] for name in candidates if name in index_of)
+
+        def _primary_and_alts(candidates: Sequence[str]) -> tuple[int, tuple[int, ...]]:
+            indices = _indices(candidates)
+            if not indices:
+                return -1, ()
+            return indices[0], indices[1:]
+
+        guid_primary, guid_alts = _primary_and_alts(GUID_COLUMNS)
+        title_primary, title_alts = _primary_and_alts(TITLE_COLUMNS)
+        date_primary, date_alts = _primary_and_alts(DATE_COLUMNS)
+        duration_primary, duration_alts = _primary_and_alts(DURATION_COLUMNS)
+        path_primary, path_alts = _primary_and_alts(PATH_COLUMNS)
+        trash_indices = _indices(TRASH_COLUMNS)
+        ref_indices = _indices(REFERENCE_COLUMNS)
+
         try:
-            rows = conn.execute(f"SELECT * FROM {table}")
+            rows = conn.execute(f"SELECT {', '.join(wanted)} FROM {table}")
         except sqlite3.Error as err:
             LOGGER.error("Failed to query metadata table %s: %s", table, err)
             return {}
 
         memos: dict[str, VoiceMemo] = {}
         for row in rows:
-            guid_raw = _pick(row, GUID_COLUMNS)
+            guid_raw = _pick_primary(row, guid_primary, guid_alts)
             if not guid_raw:
                 continue
-            guid = str(guid_raw)
+            guid = sys.intern(str(guid_raw))
 
-            path = _resolve_path(row, settings, guid)
+            path = _resolve_path(row, path_primary, path_alts, settings, guid)
 
-            trashed = any(
-                _truthy(row[name])
-                for name in TRASH_COLUMNS
-                if name in row.keys()
-            )
+            trashed = any(_truthy(row[i]) for i in trash_indices)
 
-            title_value = _pick(row, TITLE_COLUMNS)
-            created_value = _pick(row, DATE_COLUMNS)
-            duration_value = _pick(row, DURATION_COLUMNS)
+            title_value = _pick_primary(row, title_primary, title_alts)
+            created_value = _pick_primary(row, date_primary, date_alts)
+            duration_value = _pick_primary(row, duration_primary, duration_alts)
 
             if not title_value:
-                title_value = _resolve_related_title(conn, row)
+                title_value = _resolve_related_title(conn, row, ref_indices)
 
             memo = VoiceMemo(
                 guid=guid,
                 path=path,
                 title=str(title_value) if title_value is not None else None,
-                created_at=_to_datetime(created_value),
+                created_at_raw=_to_raw_timestamp(created_value),
                 duration_seconds=float(duration_value) if duration_value is not None else None,
                 is_trashed=trashed,
             )
-            memos[memo.path.stem] = memo
+            memos[sys.intern(memo.path.stem)] = memo
         return memos
 
 
-def resolve_created_at(memo: VoiceMemo) -> datetime | None:
-    """Return the most accurate creation time available for a memo."""
-    if memo.created_at:
-        return memo.created_at.astimezone(datetime.now().astimezone().tzinfo)
+def resolve_created_at(memo: VoiceMemo, cached_stat: os.stat_result | None = None) -> datetime | None:
+    """Return the most accurate creation time available for a memo.
 
-    try:
-        stats = memo.path.stat()
-    except FileNotFoundError:
-        return None
+    ``cached_stat`` lets callers reuse a stat result captured during a
+    directory scan instead of paying a second syscall per memo. Results are
+    memoized per GUID so sorting and display do not stat the same file twice.
+    """
+    if memo.guid in _CREATED_AT_CACHE:
+        return _CREATED_AT_CACHE[memo.guid]
+
+    resolved = _compute_created_at(memo, cached_stat)
+    _CREATED_AT_CACHE[memo.guid] = resolved
+    return resolved
+
+
+def _compute_created_at(memo: VoiceMemo, cached_stat: os.stat_result | None) -> datetime | None:
+    if memo.created_at_raw is not None:
+        return datetime.fromtimestamp(memo.created_at_raw + MAC_EPOCH_UNIX, tz=_LOCAL_TZ)
+
+    stats = cached_stat
+    if stats is None:
+        stats = _fscache.cached_stat(memo.path)
+        if stats is None:
+            return None
 
-    tz = datetime.now().astimezone().tzinfo
     if hasattr(stats, "st_birthtime"):
-        return datetime.fromtimestamp(stats.st_birthtime, tz=tz)
-    return datetime.fromtimestamp(stats.st_mtime, tz=tz)
+        return datetime.fromtimestamp(stats.st_birthtime, tz=_LOCAL_TZ)
+    return datetime.fromtimestamp(stats.st_mtime, tz=_LOCAL_TZ)
+
+
+def _list_without_metadata(settings: Settings) -> List[VoiceMemo]:
+    """Fast path when no metadata database exists: one scandir, no SQLite.
 
+    Creation times come straight from the stats captured during the scan,
+    so sorting and later display need no further syscalls.
+    """
+    try:
+        scanned = scan_files_with_stats(settings.recordings_dir)
+    except PermissionError as err:
+        raise PermissionError(
+            f"Unable to access {settings.recordings_dir}. Grant the terminal Full Disk Access."
+        ) from err
 
-def list_voice_memos(settings: Settings | None = None) -> List[VoiceMemo]:
+    _CREATED_AT_CACHE.clear()
+    keyed: List[tuple[float, VoiceMemo]] = []
+    for path, stat in scanned:
+        memo = VoiceMemo(guid=path.stem, path=path)
+        if stat is not None:
+            ts = getattr(stat, "st_birthtime", stat.st_mtime)
+            _CREATED_AT_CACHE[memo.guid] = datetime.fromtimestamp(ts, tz=_LOCAL_TZ)
+        else:
+            ts = 0.0
+            _CREATED_AT_CACHE[memo.guid] = None
+        keyed.append((ts, memo))
+
+    keyed.sort(key=lambda kv: kv[0], reverse=True)
+    return [memo for _, memo in keyed]
+
+
+def list_voice_memos(settings: Settings) -> List[VoiceMemo]:
     """Return Voice Memo entries for every recording on disk."""
-    settings = settings or load_settings()
+    if not os.path.lexists(settings.metadata_db) and not (
+        settings.legacy_metadata_db and os.path.lexists(settings.legacy_metadata_db)
+    ):
+        return _list_without_metadata(settings)
+
     memos = load_voice_memos(settings)
 
     results: List[VoiceMemo] = []
-    seen_paths: set[str] = set()
+    # One batched scan captures paths and stat results together; the sort
+    # below reuses the stats instead of issuing a second syscall per memo.
+    stats: dict[str, os.stat_result] = {}
     try:
-        paths = sorted(settings.recordings_dir.glob("*.m4a"))
+        scanned = scan_files_with_stats(settings.recordings_dir)
     except PermissionError as err:
         raise PermissionError(
             f"Unable to access {settings.recordings_dir}. Grant the terminal Full Disk Access."
         ) from err
 
-    for path in paths:
-        guid = path.stem
+    # Scandir entries are unique per name, so the on-disk pass needs no seen
+    # set; metadata-only entries (recently deleted files still listed by the
+    # app) are exactly the key difference afterwards.
+    disk_guids = {path.stem for path, _ in scanned}
+    for path, stat in scanned:
+        guid = sys.intern(path.stem)
+        if stat is not None:
+            stats[guid] = stat
         memo = memos.get(guid)
         if memo:
             if memo.path != path:
@@ -358,18 +542,23 @@ def list_voice_memos(settings: Settings | None = None) -> List[VoiceMemo]:
                 memos[guid] = memo
         else:
             memo = VoiceMemo(guid=guid, path=path)
-        if not memo.is_trashed and guid not in seen_paths:
+        if not memo.is_trashed:
             results.append(memo)
-            seen_paths.add(guid)
 
-    # Include metadata-only entries (for recently deleted files that are still present in app listing).
-    for memo in memos.values():
-        if memo.is_trashed:
-            continue
-        stem = memo.path.stem
-        if stem not in seen_paths:
+    for guid in memos.keys() - disk_guids:
+        memo = memos[guid]
+        if not memo.is_trashed:
             results.append(memo)
-            seen_paths.add(stem)
 
-    results.sort(key=lambda m: resolve_created_at(m) or datetime.fromtimestamp(0), reverse=True)
+    # Sort on raw floats: no datetime objects are constructed during the sort,
+    # and the scandir stats cover memos without a database timestamp.
+    def _sort_ts(memo: VoiceMemo) -> float:
+        if memo.created_at_raw is not None:
+            return memo.created_at_raw + MAC_EPOCH_UNIX
+        stat = stats.get(memo.guid)
+        if stat is not None:
+            return getattr(stat, "st_birthtime", stat.st_mtime)
+        return 0.0
+
+    results.sort(key=_sort_ts, reverse=True)
     return results
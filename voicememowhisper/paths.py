@@ -1,14 +1,54 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
 
-from .config import Settings, load_settings
+from .config import Settings
 
 
-def ensure_directories(settings: Settings | None = None) -> Settings:
-    """Ensure output directories exist and return settings."""
-    settings = settings or load_settings()
+def iter_files(directory: Path, suffix: str = ".m4a") -> Iterator[Path]:
+    """Yield matching regular files using scandir's cached entry type.
+
+    Unlike Path.glob, no Path object or stat call is made for filtered-out
+    entries, and on filesystems that report d_type the match itself costs no
+    stat at all.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False):
+                yield Path(entry.path)
+
+
+def scan_files_with_stats(
+    directory: Path, suffix: str = ".m4a"
+) -> List[Tuple[Path, Optional[os.stat_result]]]:
+    """Collect matching files and their stat results in one directory pass.
 
+    Batching the scan keeps the syscall count at one readdir plus one stat
+    per entry; callers reuse the captured stat instead of re-probing paths
+    they already know exist.
+    """
+    with os.scandir(directory) as it:
+        entries = [
+            entry
+            for entry in it
+            if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)
+        ]
+    entries.sort(key=lambda entry: entry.name)
+
+    results: List[Tuple[Path, Optional[os.stat_result]]] = []
+    for entry in entries:
+        try:
+            stat = entry.stat(follow_symlinks=False)
+        except OSError:  # pragma: no cover - entry vanished mid-scan
+            stat = None
+        results.append((Path(entry.path), stat))
+    return results
+
+
+def ensure_directories(settings: Settings) -> Settings:
+    """Ensure output directories exist and return settings."""
     settings.transcript_dir.mkdir(parents=True, exist_ok=True)
     settings.state_db.parent.mkdir(parents=True, exist_ok=True)
 
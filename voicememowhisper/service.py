@@ -1,36 +1,61 @@
 from __future__ import annotations
 
+import collections
+import fcntl
+import functools
 import logging
-import queue
+import re
 import shutil
+import sys
 import threading
 import time
 import os
 from datetime import datetime
 from dataclasses import replace
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Set
-
-from watchdog.observers import Observer
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, TYPE_CHECKING
 
 from .config import Settings, load_settings
 from .metadata import VoiceMemo, load_voice_memos, resolve_created_at
-from .paths import ensure_directories
+from .paths import ensure_directories, scan_files_with_stats
 from .state import StateStore
-from .transcribe import WhisperTranscriber
-from .watcher import start_watcher
+
+if TYPE_CHECKING:  # watchdog is only loaded when watching actually starts
+    from .watcher import WatchHandle
 
 LOGGER = logging.getLogger("service")
 
+# Sort fallback for memos with no resolvable creation time.
+_EPOCH = datetime.fromtimestamp(0)
+
+
+# Anything outside the allowed set collapses to "_" in one C-level pass;
+# \w keeps the Unicode-alnum acceptance of the old per-char loop.
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\- ]")
+
 
+@functools.lru_cache(maxsize=4096)
 def _sanitize_filename(value: str) -> str:
-    safe_chars = []
-    for ch in value:
-        if ch.isalnum() or ch in ("-", "_", " "):
-            safe_chars.append(ch)
-        else:
-            safe_chars.append("_")
-    return "".join(safe_chars).strip() or "untitled"
+    return _UNSAFE_FILENAME_RE.sub("_", value).strip() or "untitled"
+
+
+@functools.lru_cache(maxsize=4096)
+def _transcript_filename_for(guid: str, title: "str | None", created_at: "datetime | None") -> str:
+    """Build (and memoize) the transcript filename for one memo revision.
+
+    Reprocessing and archive naming ask for the same (guid, title, date)
+    repeatedly; the cache makes repeats a dict hit instead of a format+sub.
+    """
+    if created_at is None:
+        timestamp_str = "undated"
+    else:
+        timestamp_str = (
+            f"{created_at.year:04d}-{created_at.month:02d}-{created_at.day:02d}"
+            f"_{created_at.hour:02d}-{created_at.minute:02d}-{created_at.second:02d}"
+        )
+    return f"{timestamp_str}_{_sanitize_filename(title or guid)}.txt"
 
 
 class VoiceMemoService:
@@ -50,36 +75,102 @@ class VoiceMemoService:
             self.settings.archive_dir.mkdir(parents=True, exist_ok=True)
             LOGGER.info("Created archive directory at %s", self.settings.archive_dir)
 
-        try:
-            next(self.settings.recordings_dir.glob("*.m4a"))
-        except StopIteration:
-            pass
-        except PermissionError as err:
+        # access(2) answers the permission question in one syscall; the old
+        # glob-based probe iterated directory entries just to trigger EPERM.
+        if not os.access(self.settings.recordings_dir, os.R_OK | os.X_OK):
             raise PermissionError(
                 f"Insufficient permissions to read {self.settings.recordings_dir}. "
                 "Grant the terminal Full Disk Access (System Settings → Privacy & Security → Full Disk Access)."
-            ) from err
+            )
+
+        # Deferred: pulls in subprocess and the executor machinery, which
+        # importers of this module (e.g. --list) never need.
+        from .transcribe import WhisperTranscriber
 
         self.transcriber = WhisperTranscriber(self.settings)
-        self._queue: "queue.Queue[Path]" = queue.Queue()
+        # deque append/popleft are atomic in CPython, so an Event for wakeups
+        # replaces queue.Queue's mutex and condition on every put/get.
+        self._dq: "collections.deque[Optional[Path]]" = collections.deque()
+        self._pending = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
         self._stop = threading.Event()
-        self._worker_thread: Optional[threading.Thread] = None
-        self._observer: Optional[Observer] = None
+        # Transcription happens in a WhisperKit subprocess with the GIL
+        # released, so several worker threads scale until the CLI saturates
+        # the cores. VOICE_MEMO_MAX_PARALLEL=0 picks the heuristic default;
+        # the transcriber's own semaphore holds actual subprocess concurrency
+        # to the same cap no matter how the worker threads fan out.
+        configured = self.settings.max_parallel_transcriptions
+        cpus = os.cpu_count() or 2
+        self._num_workers = min(cpus, configured) if configured > 0 else max(1, cpus // 2)
+        self._workers: list[threading.Thread] = []
+        # Small pool for disk-touching prep (readiness polls, stat, metadata
+        # loads) so a batch overlaps those waits instead of serializing them
+        # in front of the transcription work.
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="vmw-io")
+        self._observer: "Optional[WatchHandle]" = None
         self.state = StateStore(self.settings.state_db)
         self._metadata: dict[str, VoiceMemo] = {}
-        self._inflight: Set[str] = set()
+        # Guards _processed, _inflight, _recently_done, and the
+        # outstanding-item count now that several workers mutate them.
+        # Reentrant because finalization updates the map and the recency
+        # cache in one critical section.
+        self._state_lock = threading.RLock()
+        # In-memory mirror of the processed table, loaded once; enqueue
+        # checks hit this dict instead of a sqlite point query per event.
+        self._processed: dict[str, tuple[Optional[Path], Optional[Path]]] = {}
+        for row in self.state.get_all_processed():
+            self._processed[sys.intern(row["guid"])] = (
+                Path(row["transcript_path"]) if row["transcript_path"] else None,
+                Path(row["archived_path"]) if row["archived_path"] else None,
+            )
+        # GUID -> enqueue time (monotonic); the timestamp doubles as a hook
+        # for spotting stalled items.
+        self._inflight: dict[str, float] = {}
+        self._outstanding = 0
+        self._watching = False
+        # Backlog items are drained in small batches so per-file overhead is
+        # amortized across a thread pool; watch mode keeps single-file latency.
+        self._batch_size = 8
+        # Bounded recency cache of GUIDs known to be fully processed; spares
+        # the sqlite lookup when the watcher re-fires for the same file.
+        self._recently_done: dict[str, None] = {}
+        self._recently_done_max = 1024
+        # Metadata DB mtime (ns) at the last load; unchanged file means the
+        # cached memo map is still current and the SQL re-read is skipped.
+        self._metadata_mtime_ns = 0
+        # Negative cache: GUID -> monotonic time of the last refresh attempt
+        # that failed to produce a metadata row. Bounds the re-read fanout to
+        # one per metadata_refresh_interval per unknown recording.
+        self._metadata_misses: dict[str, float] = {}
 
     def start(self, watch: bool = False) -> None:
-        """Start the worker thread and optionally the filesystem watcher."""
+        """Start the worker threads and optionally the filesystem watcher."""
         LOGGER.info("Starting Voice Memo transcription service")
+        self._watching = watch
         self._log_sources()
-        self._worker_thread = threading.Thread(target=self._worker_loop, name="VoiceMemoWorker", daemon=True)
-        self._worker_thread.start()
+        self._workers = [
+            threading.Thread(target=self._worker_loop, name=f"VoiceMemoWorker-{i}", daemon=True)
+            for i in range(self._num_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
 
-        self.enqueue_existing()
+        # The backlog is read exactly once; afterwards discovery is purely
+        # event-driven through the watcher.
+        self._initial_backlog_scan()
 
         if watch:
-            self._observer = start_watcher(self.settings.recordings_dir, self.enqueue_path)
+            # Deferred so one-shot runs (and zipapp cold starts) never pay
+            # for the watchdog import chain.
+            from .watcher import start_watcher
+
+            self._observer = start_watcher(
+                self.settings.recordings_dir,
+                self.enqueue_path,
+                latency=self.settings.watch_latency,
+                force_polling=self.settings.force_polling,
+            )
 
     def stop(self) -> None:
         LOGGER.info("Stopping Voice Memo transcription service")
@@ -87,57 +178,108 @@ class VoiceMemoService:
         if self._observer:
             self._observer.stop()
             self._observer.join()
-        self._queue.put(None)  # type: ignore[arg-type]
-        if self._worker_thread:
-            self._worker_thread.join()
+        for _ in self._workers:
+            self._dq.append(None)
+        self._pending.set()
+        for worker in self._workers:
+            worker.join()
+        self._io_pool.shutdown(wait=True)
         self.state.close()
 
-    def enqueue_existing(self) -> None:
+    def _initial_backlog_scan(self) -> None:
         self._refresh_metadata()
         try:
-            paths = list(self.settings.recordings_dir.glob("*.m4a"))
+            # One scandir pass captures the stat results; the sort key reuses
+            # them instead of re-statting files with no metadata row.
+            scanned = scan_files_with_stats(self.settings.recordings_dir)
         except PermissionError as err:
             LOGGER.warning("Unable to read recordings directory: %s", err)
             return
 
-        memos = []
-        for path in paths:
-            memo = self._memo_for_path(path)
-            memos.append(memo)
+        # Decorate-sort-undecorate: the key is computed exactly once per
+        # memo up front, and the sort itself only compares plain datetimes.
+        keyed = [
+            (resolve_created_at(self._memo_for_path(path), cached_stat=stat) or _EPOCH, path)
+            for path, stat in scanned
+        ]
+        keyed.sort(key=itemgetter(0), reverse=self.processing_order == "newest-first")
 
-        memos.sort(
-            key=lambda memo: resolve_created_at(memo) or datetime.fromtimestamp(0),
-            reverse=self.processing_order == "newest-first",
-        )
+        for _created_at, path in keyed:
+            self.enqueue_path(path)
 
-        for memo in memos:
-            self.enqueue_path(memo.path)
+    def _note_done(self, guid: str) -> None:
+        with self._state_lock:
+            if len(self._recently_done) >= self._recently_done_max:
+                self._recently_done.pop(next(iter(self._recently_done)))
+            self._recently_done[guid] = None
 
     def enqueue_path(self, path: Path) -> None:
-        guid = path.stem
-        if guid in self._inflight:
+        # Interned: the same GUID lives in _inflight, _metadata keys, and the
+        # recency cache, so membership tests reduce to pointer compares.
+        guid = sys.intern(path.stem)
+        # Unlocked fast path: plain membership tests on the shared containers
+        # are safe under the GIL, and reservation below re-checks under the
+        # lock, so rejected duplicates cost two dict probes and nothing else.
+        if guid in self._inflight or guid in self._recently_done:
             return
+        if self._observer is not None:
+            # A live event means the library just changed; let this GUID
+            # bypass the negative cache so its metadata is re-checked.
+            self._metadata_misses.pop(guid, None)
 
-        # Check state to decide if we need to process
-        transcript_path, archived_path = self.state.get_state(guid)
+        # Check the in-memory state mirror to decide if we need to process
+        transcript_path, archived_path = self._get_state_cached(guid)
         needs_transcription = transcript_path is None
         needs_archiving = self.settings.archive_enabled and archived_path is None
 
         if not needs_transcription and not needs_archiving:
+            self._note_done(guid)
             return
 
-        memo = self._memo_for_path(path)
-        LOGGER.debug("Enqueueing %s (Transcribe: %s, Archive: %s)", 
-                     self._display_name(memo), needs_transcription, needs_archiving)
-        self._queue.put(path)
-        self._inflight.add(guid)
+        with self._state_lock:
+            if guid in self._inflight:
+                return
+            self._inflight[guid] = time.monotonic()
+            self._outstanding += 1
+            self._idle.clear()
+        if self._observer is not None and self.processing_order == "newest-first":
+            # Live watcher arrivals are by definition the newest recordings:
+            # put them ahead of any remaining backlog so their latency does
+            # not grow with backlog size.
+            self._dq.appendleft(path)
+        else:
+            self._dq.append(path)
+        self._pending.set()
+        # Metadata (for the display name) is touched only when the item was
+        # actually queued and debug logging is on.
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Enqueueing %s (Transcribe: %s, Archive: %s)",
+                self._display_name(self._memo_for_path(path)),
+                needs_transcription,
+                needs_archiving,
+            )
+
+    def _get_state_cached(self, guid: str) -> tuple[Optional[Path], Optional[Path]]:
+        with self._state_lock:
+            return self._processed.get(guid, (None, None))
 
     def _refresh_metadata(self) -> None:
+        try:
+            mtime_ns = os.stat(self.settings.metadata_db).st_mtime_ns
+        except OSError:
+            mtime_ns = 0
+        if mtime_ns and mtime_ns == self._metadata_mtime_ns and self._metadata:
+            return
         try:
             self._metadata = load_voice_memos(self.settings)
+            self._metadata_mtime_ns = mtime_ns
+            # A real reload may resolve what previous lookups missed.
+            self._metadata_misses.clear()
         except PermissionError as err:
             LOGGER.warning("Metadata access denied: %s", err)
             self._metadata = {}
+            self._metadata_mtime_ns = 0
 
     def _display_name(self, memo: VoiceMemo) -> str:
         if memo.title:
@@ -165,95 +307,223 @@ class VoiceMemoService:
 
     def _worker_loop(self) -> None:
         while not self._stop.is_set():
+            if not self._dq:
+                if not self._pending.wait(timeout=0.5):
+                    continue
+                self._pending.clear()
+
             try:
-                item = self._queue.get(timeout=0.5)
-            except queue.Empty:
+                item = self._dq.popleft()
+            except IndexError:
                 continue
 
             if item is None:
                 break
 
-            path = item
-            memo = self._memo_for_path(path)
-            guid = memo.guid
+            batch = [item]
+            if not self._watching:
+                while len(batch) < self._batch_size:
+                    try:
+                        extra = self._dq.popleft()
+                    except IndexError:
+                        break
+                    if extra is None:
+                        # Re-park the sentinel; the current batch still runs.
+                        self._dq.appendleft(None)
+                        break
+                    batch.append(extra)
+
             try:
-                self._process_memo(memo)
+                self._process_batch(batch)
             except Exception:
-                LOGGER.exception("Failed to process %s", self._display_name(memo))
+                LOGGER.exception("Failed to process batch of %d memos", len(batch))
             finally:
-                self._queue.task_done()
-                self._inflight.discard(guid)
+                with self._state_lock:
+                    for path in batch:
+                        self._inflight.pop(path.stem, None)
+                    self._outstanding -= len(batch)
+                    if self._outstanding <= 0:
+                        self._outstanding = 0
+                        self._idle.set()
 
     def _memo_for_path(self, path: Path) -> VoiceMemo:
-        guid = path.stem
+        guid = sys.intern(path.stem)
         memo = self._metadata.get(guid)
         if memo and memo.title:
             if memo.path != path:
                 memo = replace(memo, path=path)
                 self._metadata[guid] = memo
             return memo
-        self._refresh_metadata()
-        memo = self._metadata.get(guid)
-        if memo:
-            if memo.path != path:
-                memo = replace(memo, path=path)
-                self._metadata[guid] = memo
-            return memo
+        # A recording the DB does not know about retries the reload at most
+        # once per refresh interval instead of on every lookup.
+        now = time.monotonic()
+        last_attempt = self._metadata_misses.get(guid)
+        if last_attempt is None or now - last_attempt >= self.settings.metadata_refresh_interval:
+            self._refresh_metadata()
+            memo = self._metadata.get(guid)
+            if memo:
+                self._metadata_misses.pop(guid, None)
+                if memo.path != path:
+                    memo = replace(memo, path=path)
+                    self._metadata[guid] = memo
+                return memo
+            self._metadata_misses[guid] = now
+            if len(self._metadata_misses) > 4096:
+                for stale in sorted(self._metadata_misses, key=self._metadata_misses.get)[:2048]:
+                    del self._metadata_misses[stale]
         memo = VoiceMemo(guid=guid, path=path)
         self._metadata[guid] = memo
         return memo
 
     def _transcript_filename(self, memo: VoiceMemo) -> str:
-        timestamp = resolve_created_at(memo)
-        if timestamp is None:
-            timestamp_str = "undated"
-        else:
-            timestamp_str = timestamp.strftime("%Y-%m-%d_%H-%M-%S")
-        title = memo.title or memo.guid
-        return f"{timestamp_str}_{_sanitize_filename(title)}.txt"
-
-    def _process_memo(self, memo: VoiceMemo) -> None:
-        path = memo.path
-        display = self._display_name(memo)
-        if not path.exists():
-            LOGGER.warning("Skipping missing memo %s", display)
-            return
-
-        # Newly recorded files may still be written; retry a few times.
-        for attempt in range(3):
+        return _transcript_filename_for(memo.guid, memo.title, resolve_created_at(memo))
+
+    # Two matching size samples this far apart declare the file stable.
+    _READY_POLL_INTERVAL = 0.25
+    _READY_POLL_ATTEMPTS = 20
+
+    def _wait_until_ready(self, path: Path, display: str) -> bool:
+        """Wait for the file to stop growing before handing it to WhisperKit.
+
+        A non-blocking shared flock filters out writers that hold a lock,
+        and the size must match across two consecutive samples: a recording
+        still being flushed keeps changing, so a single non-zero size is not
+        a reliable "finished" signal. Small finalized files clear in one
+        interval; large ones wait exactly as long as the writer needs.
+        """
+        prev_size = -1
+        for attempt in range(self._READY_POLL_ATTEMPTS):
+            size = -1
             try:
-                # Ensure file readable and non-empty
-                if path.stat().st_size == 0:
-                    raise OSError("File size is zero while recording may still be in progress.")
-                break
+                fd = os.open(path, os.O_RDONLY)
             except OSError as err:
                 LOGGER.debug("Memo %s not ready (%s). Retrying...", display, err)
-                time.sleep(1.0)
-        else:
-            LOGGER.error("Giving up on %s after repeated readiness checks", display)
-            return
+            else:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+                    size = os.fstat(fd).st_size
+                except OSError as err:
+                    LOGGER.debug("Memo %s still locked (%s). Retrying...", display, err)
+                finally:
+                    os.close(fd)
+            if size > 0 and size == prev_size:
+                return True
+            prev_size = size
+            time.sleep(self._READY_POLL_INTERVAL)
+        return False
+
+    def _prepare_memo(self, path: Path) -> Optional[tuple[VoiceMemo, Optional[Path], Optional[Path]]]:
+        """State/readiness/trash checks; returns (memo, transcript, archive) or None."""
+        # Fail fast on work that is already done: a spurious watcher
+        # re-trigger should cost one dict lookup, not a metadata reload.
+        guid = sys.intern(path.stem)
+        transcript_path, archived_path = self._get_state_cached(guid)
+        needs_transcription = transcript_path is None
+        needs_archiving = self.settings.archive_enabled and archived_path is None
+        if not needs_transcription and not needs_archiving:
+            self._note_done(guid)
+            return None
 
-        self._refresh_metadata()
+        if not path.exists():
+            LOGGER.warning("Skipping missing memo %s", guid)
+            return None
+
+        # Newly recorded files may still be written; probe before reading.
+        if not self._wait_until_ready(path, guid):
+            LOGGER.error("Giving up on %s after repeated readiness checks", guid)
+            return None
+
+        # Metadata is fetched only now that we know the memo needs work;
+        # _memo_for_path reloads lazily when the GUID is missing from cache.
         memo = self._memo_for_path(path)
-        display = self._display_name(memo)
 
         if memo.is_trashed:
-            LOGGER.info("Skipping trashed memo %s", display)
-            return
+            LOGGER.info("Skipping trashed memo %s", self._display_name(memo))
+            return None
+
+        return memo, transcript_path, archived_path
+
+    def _process_batch(self, paths: list[Path]) -> None:
+        prepared: list[tuple[VoiceMemo, Optional[Path], Optional[Path]]] = []
+        # Prep is I/O bound (readiness polls can sleep for seconds); fan the
+        # batch out to the I/O pool so the waits overlap, and fall back to an
+        # inline call for a single path where the pool buys nothing.
+        if len(paths) > 1:
+            futures = [(path, self._io_pool.submit(self._prepare_memo, path)) for path in paths]
+            results = [(path, future.result) for path, future in futures]
+        else:
+            results = [(path, functools.partial(self._prepare_memo, path)) for path in paths]
+        for path, get_entry in results:
+            try:
+                entry = get_entry()
+            except Exception:
+                LOGGER.exception("Failed to prepare %s", path.name)
+                continue
+            if entry is not None:
+                prepared.append(entry)
+
+        # Longest memos first keeps the transcription pool busy to the end.
+        pending = [entry for entry in prepared if entry[1] is None]
+        pending.sort(key=lambda entry: entry[0].duration_seconds or 0.0, reverse=True)
+
+        texts: dict[str, str] = {}
+        if len(pending) > 1:
+            # Each worker gets its share of the subprocess cap; with several
+            # workers that is one in-batch subprocess each, so the worker
+            # pool and the batch pool never multiply. The transcriber's
+            # semaphore backstops the cap either way.
+            in_batch_workers = max(1, self.transcriber.max_parallel // self._num_workers)
+            results = self.transcriber.transcribe_batch(
+                [entry[0].path for entry in pending],
+                labels=[self._display_name(entry[0]) for entry in pending],
+                max_workers=in_batch_workers,
+            )
+            for entry, text in zip(pending, results):
+                if text is not None:
+                    texts[entry[0].guid] = text
+        elif pending:
+            memo = pending[0][0]
+            try:
+                texts[memo.guid] = self.transcriber.transcribe(
+                    memo.path, label=self._display_name(memo)
+                )
+            except Exception:
+                LOGGER.exception("Failed to transcribe %s", self._display_name(memo))
+
+        for memo, transcript_path, archived_path in prepared:
+            if transcript_path is None and memo.guid not in texts:
+                continue  # transcription failed; leave it for the next pass
+            try:
+                self._finalize_memo(memo, texts.get(memo.guid), transcript_path, archived_path)
+            except Exception:
+                LOGGER.exception("Failed to process %s", self._display_name(memo))
 
-        transcript_path, archived_path = self.state.get_state(memo.guid)
+    def _finalize_memo(
+        self,
+        memo: VoiceMemo,
+        text: Optional[str],
+        transcript_path: Optional[Path],
+        archived_path: Optional[Path],
+    ) -> None:
+        display = self._display_name(memo)
 
         # 1. Transcription
-        if transcript_path is None:
+        if transcript_path is None and text is not None:
             filename = self._transcript_filename(memo)
             LOGGER.info("Memo title: %s", display)
             LOGGER.info("Transcript file: %s", filename)
 
-            text = self.transcriber.transcribe(path, label=display)
-            
             output_path = self.settings.transcript_dir / filename
             LOGGER.info("Writing transcript for %s to %s", display, output_path.name)
-            output_path.write_text(text + "\n", encoding="utf-8")
+            # Raw binary write: one encode, no TextIOWrapper, and no full-size
+            # temporary from concatenating the trailing newline. Staged through
+            # a .part file in the same directory so a crash mid-write never
+            # leaves a partial transcript at the final name.
+            tmp_path = output_path.with_suffix(output_path.suffix + ".part")
+            with open(tmp_path, "wb", buffering=0) as fh:
+                fh.write(text.encode("utf-8"))
+                fh.write(b"\n")
+            os.replace(tmp_path, output_path)
             transcript_path = output_path
 
         # 2. Archiving
@@ -265,7 +535,7 @@ class VoiceMemoService:
         if transcript_path:
             created_at = resolve_created_at(memo)
             created_at_str = created_at.isoformat() if created_at else None
-            
+
             self.state.mark_processed(
                 guid=memo.guid,
                 transcript_path=transcript_path,
@@ -274,6 +544,10 @@ class VoiceMemoService:
                 duration=memo.duration_seconds,
                 created_at=created_at_str
             )
+            with self._state_lock:
+                self._processed[memo.guid] = (transcript_path, archived_path)
+                if not (self.settings.archive_enabled and archived_path is None):
+                    self._note_done(memo.guid)
 
     def _archive_memo(self, memo: VoiceMemo, transcript_filename: str) -> Optional[Path]:
         if not self.settings.archive_dir:
@@ -298,4 +572,6 @@ class VoiceMemoService:
             return None
 
     def join(self) -> None:
-        self._queue.join()
\ No newline at end of file
+        # Idle is driven by the outstanding-item count, so a plain wait
+        # covers both an empty queue and workers mid-batch.
+        self._idle.wait()
\ No newline at end of file
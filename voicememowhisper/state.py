@@ -1,19 +1,39 @@
 from __future__ import annotations
 
+import logging
+import queue
 import sqlite3
 import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Iterable, Set, Optional
 
+LOGGER = logging.getLogger("state")
+
 
 class StateStore:
-    """Persist processed voice memo GUIDs in a sqlite database."""
+    """Persist processed voice memo GUIDs in a sqlite database.
+
+    All statements run on one dedicated DB thread fed through a request
+    queue: writes are fire-and-forget rows coalesced into executemany
+    batches, reads travel as (op, args, Future) requests and are answered
+    after every write queued before them has been applied. No Python lock
+    serializes callers, and the per-commit WAL fsync is amortized across
+    many memos instead of being paid on each mark_processed call.
+    """
+
+    _FLUSH_BATCH = 64
+    _FLUSH_INTERVAL = 0.1
 
     def __init__(self, path: Path) -> None:
         self.path = path
         self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
-        self._lock = threading.Lock()
         self._conn.execute("PRAGMA journal_mode=WAL;")
+        # WAL makes NORMAL durable enough here; it skips the fsync-per-commit
+        # that FULL pays, which dominates backlog syncs of many small rows.
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute("PRAGMA temp_store=MEMORY;")
+        self._conn.execute("PRAGMA mmap_size=134217728;")
         self._conn.execute(
             """
             CREATE TABLE IF NOT EXISTS processed (
@@ -42,19 +62,156 @@ class StateStore:
             
         self._conn.commit()
 
+        # Queue items: (op, args, future). Write ops carry no future.
+        self._requests: "queue.Queue[tuple[str, tuple, Optional[Future]]]" = queue.Queue()
+        self._db_thread = threading.Thread(target=self._db_loop, name="StateStoreDB", daemon=True)
+        self._db_thread.start()
+
+    _INSERT_SQL = """
+            INSERT INTO processed (guid, transcript_path, archived_path, title, duration, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(guid) DO UPDATE SET
+                transcript_path = excluded.transcript_path,
+                archived_path = excluded.archived_path,
+                title = excluded.title,
+                duration = excluded.duration,
+                created_at = excluded.created_at,
+                updated_at = CURRENT_TIMESTAMP;
+            """
+
+    def _db_loop(self) -> None:
+        try:
+            self._db_loop_inner()
+        finally:
+            # Whether the exit was an orderly stop or a crash, no caller may
+            # be left blocked on an unresolved future.
+            self._drain_on_exit()
+
+    def _db_loop_inner(self) -> None:
+        while True:
+            try:
+                item = self._requests.get(timeout=self._FLUSH_INTERVAL)
+            except queue.Empty:
+                continue
+
+            rows: list[tuple] = []
+            shutdown = False
+            while True:
+                op, args, future = item
+                if op == "stop":
+                    shutdown = True
+                elif op == "mark":
+                    rows.append(args)
+                else:
+                    # Apply queued writes first so the read observes them.
+                    self._apply(rows)
+                    rows = []
+                    try:
+                        future.set_result(self._run_read(op, args))
+                    except Exception as err:  # pragma: no cover - surfaced via future
+                        future.set_exception(err)
+                if shutdown or len(rows) >= self._FLUSH_BATCH:
+                    break
+                try:
+                    item = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+
+            self._apply(rows)
+            if shutdown:
+                return
+
+    def _drain_on_exit(self) -> None:
+        rows: list[tuple] = []
+        while True:
+            try:
+                op, args, future = self._requests.get_nowait()
+            except queue.Empty:
+                break
+            if op == "mark":
+                rows.append(args)
+            elif future is not None:
+                future.set_exception(RuntimeError("StateStore is closed"))
+        self._apply(rows)
+
+    def _apply(self, rows: list[tuple]) -> None:
+        if not rows:
+            return
+        try:
+            self._conn.executemany(self._INSERT_SQL, rows)
+            self._conn.commit()
+        except sqlite3.Error:
+            # A transient failure (e.g. database is locked past the busy
+            # timeout) must not kill the DB thread: roll back, drop this
+            # batch with an explicit error, and keep serving. The affected
+            # memos are re-discovered and re-marked on the next run, so a
+            # dropped row costs a redo, never corruption.
+            try:
+                self._conn.rollback()
+            except sqlite3.Error:  # pragma: no cover - connection gone
+                pass
+            LOGGER.error(
+                "Failed to persist %d processed row(s) (guids: %s); dropping batch",
+                len(rows),
+                ", ".join(row[0] for row in rows),
+                exc_info=True,
+            )
+
+    def _run_read(self, op: str, args: tuple):
+        if op == "flush":
+            return None
+        if op == "is_processed":
+            cursor = self._conn.execute("SELECT 1 FROM processed WHERE guid = ? LIMIT 1;", args)
+            return cursor.fetchone() is not None
+        if op == "known_guids":
+            return {row[0] for row in self._conn.execute("SELECT guid FROM processed;")}
+        if op == "get_state":
+            cursor = self._conn.execute(
+                "SELECT transcript_path, archived_path FROM processed WHERE guid = ? LIMIT 1;", args
+            )
+            row = cursor.fetchone()
+            if row:
+                return (Path(row[0]) if row[0] else None, Path(row[1]) if row[1] else None)
+            return (None, None)
+        if op == "get_all":
+            self._conn.row_factory = sqlite3.Row
+            try:
+                return self._conn.execute("SELECT * FROM processed").fetchall()
+            finally:
+                self._conn.row_factory = None # Reset row factory
+        raise ValueError(f"Unknown state operation: {op}")
+
+    def _request(self, op: str, args: tuple = ()):
+        if not self._db_thread.is_alive():
+            raise RuntimeError(f"StateStore DB thread is not running; cannot serve '{op}'")
+        future: Future = Future()
+        self._requests.put((op, args, future))
+        # Poll with a timeout instead of blocking indefinitely: should the DB
+        # thread die between the check above and servicing this request, the
+        # exit drain fails the future; the liveness re-check is a backstop.
+        while True:
+            try:
+                return future.result(timeout=1.0)
+            except FutureTimeoutError:
+                if not self._db_thread.is_alive() and not future.done():
+                    raise RuntimeError(
+                        f"StateStore DB thread exited before serving '{op}'"
+                    ) from None
+
+    def flush(self) -> None:
+        """Block until every previously queued write is committed."""
+        self._request("flush")
+
     def close(self) -> None:
-        with self._lock:
-            self._conn.close()
+        self._requests.put(("stop", (), None))
+        self._db_thread.join()
+        self._conn.close()
 
     def is_processed(self, guid: str) -> bool:
-        with self._lock:
-            cursor = self._conn.execute("SELECT 1 FROM processed WHERE guid = ? LIMIT 1;", (guid,))
-            return cursor.fetchone() is not None
+        return self._request("is_processed", (guid,))
 
     def known_guids(self) -> Set[str]:
-        with self._lock:
-            cursor = self._conn.execute("SELECT guid FROM processed;")
-            return {row[0] for row in cursor.fetchall()}
+        return self._request("known_guids")
 
     def mark_processed(
         self, 
@@ -65,49 +222,31 @@ class StateStore:
         duration: Optional[float] = None,
         created_at: Optional[str] = None
     ) -> None:
-        with self._lock:
-            self._conn.execute(
-                """
-            INSERT INTO processed (guid, transcript_path, archived_path, title, duration, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(guid) DO UPDATE SET
-                transcript_path = excluded.transcript_path,
-                archived_path = excluded.archived_path,
-                title = excluded.title,
-                duration = excluded.duration,
-                created_at = excluded.created_at,
-                updated_at = CURRENT_TIMESTAMP;
-            """,
+        # Enqueue only; the DB thread owns the INSERT and the commit.
+        self._requests.put(
+            (
+                "mark",
                 (
-                    guid, 
-                    str(transcript_path), 
+                    guid,
+                    str(transcript_path),
                     str(archived_path) if archived_path else None,
                     title,
                     duration,
-                    created_at
+                    created_at,
                 ),
+                None,
             )
-            self._conn.commit()
+        )
 
     def get_state(self, guid: str) -> tuple[Optional[Path], Optional[Path]]:
         """Retrieve transcript_path and archived_path for a given GUID."""
-        with self._lock:
-            cursor = self._conn.execute(
-                "SELECT transcript_path, archived_path FROM processed WHERE guid = ? LIMIT 1;", (guid,)
-            )
-            row = cursor.fetchone()
-            if row:
-                transcript_path = Path(row[0]) if row[0] else None
-                archived_path = Path(row[1]) if row[1] else None
-                return transcript_path, archived_path
-            return None, None
-
-    def get_all_processed(self) -> list[dict]:
-        """Retrieve all processed records with metadata."""
-        with self._lock:
-            self._conn.row_factory = sqlite3.Row
-            cursor = self._conn.execute("SELECT * FROM processed")
-            rows = [dict(row) for row in cursor.fetchall()]
-            self._conn.row_factory = None # Reset row factory
-            return rows
+        return self._request("get_state", (guid,))
+
+    def get_all_processed(self) -> list[sqlite3.Row]:
+        """Retrieve all processed records with metadata.
+
+        Rows are returned as sqlite3.Row: name and index lookups happen at
+        C level with no per-row dict copy.
+        """
+        return self._request("get_all")
 
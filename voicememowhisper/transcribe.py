@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import logging
+import os
 import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from .config import Settings, load_settings
 
@@ -17,6 +20,13 @@ class WhisperTranscriber:
     def __init__(self, settings: Optional[Settings] = None) -> None:
         self.settings = settings or load_settings()
         self._cli = self._resolve_cli_binary(self.settings.whisperkit_cli)
+        configured = self.settings.max_parallel_transcriptions
+        self.max_parallel = configured if configured > 0 else max(1, (os.cpu_count() or 2) // 2)
+        # Hard cap on concurrent CLI subprocesses, enforced here rather than
+        # in each caller's thread pool: every process loads its own model, so
+        # however callers layer their threads, at most max_parallel WhisperKit
+        # instances exist at once.
+        self._subprocess_slots = threading.BoundedSemaphore(self.max_parallel)
 
     @staticmethod
     def _resolve_cli_binary(binary: str) -> str:
@@ -56,13 +66,63 @@ class WhisperTranscriber:
 
         LOGGER.info("Transcribing %s with WhisperKit (%s)", display, self.settings.whisperkit_model)
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            LOGGER.error("WhisperKit CLI failed (%s): %s", result.returncode, result.stderr.strip())
+        # Stream stdout as the CLI produces it instead of buffering the whole
+        # transcript in the pipe; stderr is drained on a side thread so a
+        # chatty CLI cannot deadlock against a full pipe.
+        with self._subprocess_slots:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1
+            )
+            stderr_chunks: List[str] = []
+            drain = threading.Thread(
+                target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+            )
+            drain.start()
+            chunks = list(proc.stdout)
+            proc.stdout.close()
+            returncode = proc.wait()
+            drain.join()
+        if returncode != 0:
+            stderr_text = "".join(stderr_chunks).strip()
+            LOGGER.error("WhisperKit CLI failed (%s): %s", returncode, stderr_text)
             raise RuntimeError(
                 f"WhisperKit CLI transcription failed for {display} "
-                f"(exit code {result.returncode}). See logs for details."
+                f"(exit code {returncode}). See logs for details."
             )
 
-        text = result.stdout.strip()
-        return text
+        return "".join(chunks).strip()
+
+    def transcribe_batch(
+        self,
+        paths: Sequence[Path],
+        *,
+        labels: Sequence[str | None] | None = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Optional[str]]:
+        """Transcribe several files concurrently, one CLI subprocess each.
+
+        The GIL is released while each worker blocks on its subprocess, so a
+        small thread pool amortizes per-file overhead during backlog syncs.
+        Callers that already parallelize (the service worker pool) pass
+        ``max_workers`` with their share of the budget; the default spends
+        the whole subprocess cap. Returns texts aligned with ``paths``;
+        failed items are None and are logged rather than raised so one bad
+        file cannot sink the batch.
+        """
+        if labels is None:
+            labels = [None] * len(paths)
+
+        budget = self.max_parallel if max_workers is None else max(1, max_workers)
+        max_workers = min(len(paths), budget)
+        results: List[Optional[str]] = [None] * len(paths)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.transcribe, path, label=label): index
+                for index, (path, label) in enumerate(zip(paths, labels))
+            }
+            for future, index in futures.items():
+                try:
+                    results[index] = future.result()
+                except Exception:
+                    LOGGER.exception("Batch transcription failed for %s", paths[index].name)
+        return results
@@ -1,21 +1,67 @@
 from __future__ import annotations
 
+import atexit
 import logging
+import threading
+import time
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Optional
 
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.events import FileSystemEvent, PatternMatchingEventHandler
 from watchdog.observers import Observer
 
+from . import _fscache
+
 LOGGER = logging.getLogger("watcher")
 
+# Filesystem types where inotify/FSEvents never fire, so a scheduled watch
+# would silently see nothing.
+_NETWORK_FS_TYPES = {"smbfs", "cifs", "smb3", "nfs", "nfs4", "afpfs", "webdav", "fuse.sshfs"}
+
+
+def _is_network_filesystem(directory: Path) -> bool:
+    """Best-effort check whether the directory sits on a network mount.
+
+    Consults /proc/mounts where the kernel provides it (Linux); elsewhere we
+    cannot cheaply learn the fs type and assume a local mount — users on a
+    network-mounted library can force polling via VOICE_MEMO_FORCE_POLLING.
+    """
+    try:
+        with open("/proc/mounts", encoding="utf-8") as fh:
+            mounts = [line.split() for line in fh]
+    except OSError:
+        return False
+    resolved = str(directory.resolve())
+    best_fstype = ""
+    best_len = -1
+    for fields in mounts:
+        if len(fields) < 3:
+            continue
+        mount_point = fields[1]
+        if (resolved == mount_point or resolved.startswith(mount_point.rstrip("/") + "/")) and len(
+            mount_point
+        ) > best_len:
+            best_len = len(mount_point)
+            best_fstype = fields[2]
+    return best_fstype in _NETWORK_FS_TYPES
+
 
-class RecordingHandler(FileSystemEventHandler):
-    """Dispatch events for new or updated recording files."""
+class RecordingHandler(PatternMatchingEventHandler):
+    """Dispatch events for new or updated recording files.
+
+    Pattern matching happens inside watchdog before dispatch, so events for
+    sync temp files (.m4a.tmp, .icloud placeholders) never reach our code.
+    """
+
+    _DEBOUNCE_SECONDS = 0.5
 
     def __init__(self, callback: Callable[[Path], None]) -> None:
-        super().__init__()
+        super().__init__(patterns=["*.m4a"], ignore_directories=True)
         self._callback = callback
+        # Last-event time per path; an in-progress write fires a burst of
+        # modifications and only the first within the window should cost a
+        # callback dispatch.
+        self._last: dict[str, float] = {}
 
     def on_created(self, event: FileSystemEvent) -> None:  # pragma: no cover - relies on filesystem
         self._handle_event(event)
@@ -24,18 +70,86 @@ class RecordingHandler(FileSystemEventHandler):
         self._handle_event(event)
 
     def _handle_event(self, event: FileSystemEvent) -> None:
-        if event.is_directory:
-            return
-        path = Path(event.src_path)
-        if path.suffix.lower() != ".m4a":
+        now = time.monotonic()
+        if now - self._last.get(event.src_path, 0.0) < self._DEBOUNCE_SECONDS:
             return
-        self._callback(path)
+        self._last[event.src_path] = now
+        if len(self._last) > 256:
+            # Drop entries older than the window; the dict stays tiny.
+            cutoff = now - self._DEBOUNCE_SECONDS
+            self._last = {k: v for k, v in self._last.items() if v >= cutoff}
+        # The recordings tree changed; cached filesystem probes are stale.
+        _fscache.invalidate()
+        self._callback(Path(event.src_path))
+
+
+# One observer (kernel notifier + dispatch thread) for the whole process;
+# additional watches share it via schedule() instead of spawning their own.
+_OBSERVER: Optional[Observer] = None
+_OBSERVER_LOCK = threading.Lock()
+
+
+def _shared_observer(latency: float = 1.0, *, polling: bool = False) -> Observer:
+    global _OBSERVER
+    with _OBSERVER_LOCK:
+        if _OBSERVER is None:
+            if polling:
+                from watchdog.observers.polling import PollingObserver as observer_cls
+            else:
+                observer_cls = Observer
+            # The observer timeout is how long the emitter may gather events
+            # per wakeup (the scan interval, for the polling backend), so
+            # bursts of writes are batched kernel-side where the backend
+            # supports it rather than dispatched one by one.
+            _OBSERVER = observer_cls(timeout=latency)
+            _OBSERVER.daemon = True
+            _OBSERVER.start()
+            atexit.register(_shutdown_observer)
+        return _OBSERVER
+
+
+def _shutdown_observer() -> None:
+    global _OBSERVER
+    with _OBSERVER_LOCK:
+        observer, _OBSERVER = _OBSERVER, None
+    if observer is not None:
+        observer.stop()
+        observer.join()
+
+
+class WatchHandle:
+    """Handle for one scheduled watch on the shared observer."""
+
+    def __init__(self, observer: Observer, watch) -> None:
+        self._observer = observer
+        self._watch = watch
+
+    def stop(self) -> None:
+        self._observer.unschedule(self._watch)
+
+    def join(self) -> None:
+        # The shared observer thread outlives individual watches; atexit
+        # tears it down.
+        pass
+
 
+def start_watcher(
+    directory: Path,
+    callback: Callable[[Path], None],
+    *,
+    latency: float = 1.0,
+    force_polling: bool = False,
+) -> WatchHandle:
+    """Schedule a watch for the given directory on the shared observer.
 
-def start_watcher(directory: Path, callback: Callable[[Path], None]) -> Observer:
-    """Start a watchdog observer for the given directory."""
-    observer = Observer()
-    observer.schedule(RecordingHandler(callback), str(directory), recursive=False)
-    observer.start()
-    LOGGER.info("Watching %s for new recordings", directory)
-    return observer
+    Network mounts (CIFS/SMB, NFS) never deliver inotify/FSEvents, so for
+    those — or when force_polling is set — the fallback PollingObserver
+    scans the tree every ``latency`` seconds instead.
+    """
+    polling = force_polling or _is_network_filesystem(directory)
+    observer = _shared_observer(latency, polling=polling)
+    watch = observer.schedule(RecordingHandler(callback), str(directory), recursive=False)
+    # Name the backend so a silent regression to polling shows up in logs
+    # (watchdog picks FSEvents on macOS, inotify on Linux).
+    LOGGER.info("Watching %s for new recordings (%s)", directory, type(observer).__name__)
+    return WatchHandle(observer, watch)